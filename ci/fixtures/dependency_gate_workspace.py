@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Fixture check for Gate 4 (Dependency Integrity) workspace lockfile coverage.
+
+Builds throwaway repos in a temp dir, runs a copy of `ci/scripts/dependency_gate.py`
+against each, and asserts that a root lockfile only covers packages matched by the
+root workspace globs:
+- a workspace member without its own lockfile PASSes (covered by the root lockfile);
+- a non-member package without its own lockfile still FAILs.
+
+Exit code: 0 when every case behaves as expected, 1 otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GATE_SCRIPT = REPO_ROOT / "ci" / "scripts" / "dependency_gate.py"
+
+MEMBER_DIR = "packages/member"
+NON_MEMBER_DIR = "tools/unrelated"
+
+# name -> (files relative to the fixture root, expected conclusion per package dir)
+CASES: Dict[str, Tuple[Dict[str, str], Dict[str, str]]] = {
+    "npm workspaces": (
+        {
+            "package.json": json.dumps({"private": True, "workspaces": ["packages/*"]}),
+            "package-lock.json": "{}",
+            f"{MEMBER_DIR}/package.json": json.dumps({"name": "member"}),
+            f"{NON_MEMBER_DIR}/package.json": json.dumps({"name": "unrelated"}),
+        },
+        {MEMBER_DIR: "PASS", NON_MEMBER_DIR: "FAIL"},
+    ),
+    "pnpm workspace": (
+        {
+            "package.json": json.dumps({"private": True}),
+            "pnpm-workspace.yaml": "packages:\n  - 'packages/*'\n",
+            "pnpm-lock.yaml": "lockfileVersion: '6.0'\n",
+            f"{MEMBER_DIR}/package.json": json.dumps({"name": "member"}),
+            f"{NON_MEMBER_DIR}/package.json": json.dumps({"name": "unrelated"}),
+        },
+        {MEMBER_DIR: "PASS", NON_MEMBER_DIR: "FAIL"},
+    ),
+}
+
+
+def _conclusions(report: str) -> Dict[str, str]:
+    # Maps "### <dir>/package.json" headings to the conclusion line that follows.
+    out: Dict[str, str] = {}
+    heading = None
+    for line in report.splitlines():
+        if line.startswith("### "):
+            heading = line[4:].strip()
+        elif heading and line.startswith("- conclusion: "):
+            out[heading] = line[len("- conclusion: ") :].strip()
+            heading = None
+    return out
+
+
+def _run_case(files: Dict[str, str], expected: Dict[str, str]) -> List[str]:
+    errors: List[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for rel, content in files.items():
+            target = root / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content, encoding="utf-8")
+        scripts_dir = root / "ci" / "scripts"
+        scripts_dir.mkdir(parents=True)
+        shutil.copy2(GATE_SCRIPT, scripts_dir / GATE_SCRIPT.name)
+
+        completed = subprocess.run(
+            [sys.executable, str(scripts_dir / GATE_SCRIPT.name)],
+            cwd=str(root),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+        report_path = root / "ci_artifacts" / "dependency-audit.md"
+        if not report_path.is_file():
+            return [f"no report written (rc={completed.returncode}): {completed.stderr.strip()[:200]}"]
+        got = _conclusions(report_path.read_text(encoding="utf-8"))
+
+    for pkg_dir, conclusion in expected.items():
+        actual = got.get(f"{pkg_dir}/package.json")
+        if actual != conclusion:
+            errors.append(f"{pkg_dir}: expected {conclusion}, got {actual}")
+    expected_rc = 2 if "FAIL" in expected.values() else 0
+    if completed.returncode != expected_rc:
+        errors.append(f"exit code: expected {expected_rc}, got {completed.returncode}")
+    return errors
+
+
+def main() -> int:
+    failed = False
+    for name, (files, expected) in CASES.items():
+        errors = _run_case(files, expected)
+        if errors:
+            failed = True
+            print(f"FAIL {name}:", file=sys.stderr)
+            for e in errors:
+                print(f"- {e}", file=sys.stderr)
+        else:
+            print(f"PASS {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Fixture check for gates that read changed paths from git with `-z`.
+
+`-z` turns off git's path quoting, so a non-UTF-8 filename reaches the gates as raw
+bytes. Builds a throwaway git repo containing such a file, runs a copy of each gate
+against it (both the base...head diff and the `git status` fallback), and asserts
+that the gate still reaches a verdict and reports the path in escaped form.
+
+Exit code: 0 when every case behaves as expected, 1 otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+COMMITTED_NAME = b"app/bad\xff.py"
+UNTRACKED_NAME = b"app/new\xfe.py"
+COMMITTED_DISPLAY = "app/bad\\xff.py"
+UNTRACKED_DISPLAY = "app/new\\xfe.py"
+
+# script -> (extra repo files to copy, report path, exit codes that count as a verdict)
+GATES: Dict[str, Tuple[Sequence[str], str, Sequence[int]]] = {
+    "mvp_scope_gate.py": (["ci/mvp-scope-rules.yml"], "ci_artifacts/mvp-scope-report.json", (0, 2)),
+    "preflight.py": ([], "ci_artifacts/preflight-report.json", (0, 2)),
+    "release_readiness_gate.py": ([], "ci_artifacts/release-readiness-report.json", (0, 2)),
+}
+
+GIT_ENV_KEYS = ("GITHUB_BASE_SHA", "GITHUB_HEAD_SHA", "BASE_SHA", "HEAD_SHA", "GITHUB_EVENT_PATH")
+
+
+def _git(root: Path, *args: str) -> str:
+    completed = subprocess.run(
+        ["git", "-c", "user.name=fixture", "-c", "user.email=fixture@example.invalid", *args],
+        cwd=str(root),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    return completed.stdout.strip()
+
+
+def _make_repo(root: Path) -> Tuple[str, str]:
+    _git(root, "init", "-q")
+    (root / "app").mkdir()
+    (root / "app" / "ok.py").write_text("x = 1\n", encoding="utf-8")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "base")
+    base = _git(root, "rev-parse", "HEAD")
+    with open(os.path.join(os.fsencode(root), COMMITTED_NAME), "wb") as f:
+        f.write(b"y = 2\n")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "head")
+    head = _git(root, "rev-parse", "HEAD")
+    with open(os.path.join(os.fsencode(root), UNTRACKED_NAME), "wb") as f:
+        f.write(b"z = 3\n")
+    return base, head
+
+
+def _run_gate(root: Path, script: str, env_extra: Dict[str, str]) -> Tuple[int, str]:
+    env = {k: v for k, v in os.environ.items() if k not in GIT_ENV_KEYS}
+    env.update(env_extra)
+    completed = subprocess.run(
+        [sys.executable, str(root / "ci" / "scripts" / script)],
+        cwd=str(root),
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        check=False,
+    )
+    return completed.returncode, completed.stderr.strip()
+
+
+def _check(
+    root: Path, script: str, report_rel: str, verdict_codes: Sequence[int], env_extra: Dict[str, str], expect: str
+) -> List[str]:
+    rc, stderr = _run_gate(root, script, env_extra)
+    if rc not in verdict_codes:
+        return [f"exit code {rc} (expected one of {list(verdict_codes)}): {stderr[:200]}"]
+    try:
+        report = json.loads((root / report_rel).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        return [f"unreadable report {report_rel}: {e}"]
+    changed = report.get("changed_files")
+    if not isinstance(changed, list) or expect not in changed:
+        return [f"changed_files does not contain {expect!r}: {changed!r}"]
+    return []
+
+
+def main() -> int:
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        try:
+            base, head = _make_repo(root)
+        except OSError as e:
+            # Some filesystems (e.g. APFS) reject non-UTF-8 names outright.
+            print(f"SKIP: cannot create a non-UTF-8 filename here: {e}")
+            return 0
+        scripts_dir = root / "ci" / "scripts"
+        scripts_dir.mkdir(parents=True)
+
+        for script, (extra_files, report_rel, verdict_codes) in GATES.items():
+            shutil.copy2(REPO_ROOT / "ci" / "scripts" / script, scripts_dir / script)
+            for rel in extra_files:
+                shutil.copy2(REPO_ROOT / rel, root / rel)
+
+            cases: List[Tuple[str, Dict[str, str], str]] = [
+                ("diff", {"GITHUB_BASE_SHA": base, "GITHUB_HEAD_SHA": head}, COMMITTED_DISPLAY),
+                ("status", {}, UNTRACKED_DISPLAY),
+            ]
+            for mode, env_extra, expect in cases:
+                shutil.rmtree(root / "ci_artifacts", ignore_errors=True)
+                errors = _check(root, script, report_rel, verdict_codes, env_extra, expect)
+                if errors:
+                    failed = True
+                    print(f"FAIL {script} ({mode}):", file=sys.stderr)
+                    for e in errors:
+                        print(f"- {e}", file=sys.stderr)
+                else:
+                    print(f"PASS {script} ({mode})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -26,14 +26,17 @@ Fail conditions (subset of plan 4.2/4.3 that are machine-checkable without build
 
 Lock/pin expectations (minimal, to keep the gate usable early):
 - Flutter: presence of `pubspec.lock` next to `pubspec.yaml`.
-- Node: presence of one of `package-lock.json`, `pnpm-lock.yaml`, `yarn.lock`.
+- Node: presence of one of `package-lock.json`, `pnpm-lock.yaml`, `yarn.lock`
+  (a lockfile at the repo root also covers the packages matched by the root workspace
+  globs, i.e. `packages:` in `pnpm-workspace.yaml` or `workspaces` in `package.json`).
 - Python: presence of one of `requirements.txt`, `requirements.lock`,
   `poetry.lock`, `pdm.lock`, `uv.lock`, or `requirements.txt` with pinned
   versions (best effort).
 
 Runtime load-path proof:
 - For Node: if both `package.json` and `package-lock.json` exist AND `node_modules`
-  exists, attempt `node -p "require.resolve('<pkg>')"` for direct deps.
+  exists, resolve direct deps with `require.resolve` (one `node` process per
+  project, no shell).
 - For Python: if a venv is active and deps are installed, attempt to import and
   show module file path. Otherwise mark as N/A.
 - Flutter: runtime path proof is marked N/A here (requires Flutter toolchain).
@@ -47,17 +50,66 @@ from __future__ import annotations
 import json
 import os
 import re
+import shutil
+import subprocess
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 ARTIFACTS_DIR = REPO_ROOT / "ci_artifacts"
 REPORT_MD_PATH = ARTIFACTS_DIR / "dependency-audit.md"
 
+EXCLUDE_DIRS_LOWER = frozenset(
+    d.lower()
+    for d in (".git", ".idea", "ci_artifacts", "node_modules", "build", "dist", "generated", ".dart_tool", ".venv", "__pycache__")
+)
+
+# Resolves every name passed after `--` and prints `<name>\t<OK|ERR>\t<path or message>`.
+NODE_RESOLVE_SCRIPT = (
+    "for (const n of process.argv.slice(1)) {"
+    " try { console.log(n + '\\tOK\\t' + require.resolve(n)); }"
+    " catch (e) { console.log(n + '\\tERR\\t' + String(e.message).split('\\n')[0]); }"
+    " }"
+)
+
+# A requirements line counts as pinned when it is blank/comment, an option or `-r` include,
+# a direct URL/git ref with `@` (pinned by commit, best effort), or a `==`/`===` pin.
+_PINNED_REQ_RE = re.compile(r"\s*(?:$|#|-r \s*\S|--|(?=.*@)(?=.*(?:git\+|https?://))|.*==)")
+
+# Path fragments that suggest third-party source was copied into the repo.
+VENDORED_PATH_SEGMENTS = (
+    "/vendor/",
+    "/third_party/",
+    "/third-party/",
+    "/3rdparty/",
+    "/deps/",
+    "/dependencies/",
+)
+
+PYTHON_LOCK_NAMES = ("poetry.lock", "pdm.lock", "uv.lock")
+
+# Every filename any audit section needs; collected in one repo walk.
+SCANNED_FILE_NAMES = (
+    "README.md",
+    "pubspec.yaml",
+    "package.json",
+    "requirements.txt",
+    "requirements.lock",
+    "pyproject.toml",
+    "poetry.lock",
+    "pdm.lock",
+    "uv.lock",
+)
+
 
 @dataclass
 class Violation:
@@ -72,44 +124,58 @@ def _utc_now() -> str:
 
 def _write_report(md: str) -> None:
     ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
-    REPORT_MD_PATH.write_text(md, encoding="utf-8")
+    # Temp file + rename, so readers never see a half-written report.
+    tmp_path = REPORT_MD_PATH.with_suffix(".md.tmp")
+    try:
+        tmp_path.write_text(md, encoding="utf-8")
+        os.replace(tmp_path, REPORT_MD_PATH)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def _iter_files(names: Sequence[str]) -> Iterable[Path]:
-    # Keep it simple: find by exact filename anywhere under repo (excluding common build dirs)
-    exclude_dirs = {".git", ".idea", "ci_artifacts", "node_modules", "build", "dist", "generated", ".dart_tool", ".venv", "__pycache__"}
-    for p in REPO_ROOT.rglob("*"):
-        if not p.is_file():
-            continue
-        parts = {x.lower() for x in p.parts}
-        if any(ed.lower() in parts for ed in exclude_dirs):
-            continue
-        if p.name in names:
-            yield p
+    # Single pass over the repo (excluding common build dirs); excluded subtrees are never entered.
+    wanted = frozenset(names)
+    for root, dirs, files in os.walk(REPO_ROOT, followlinks=False):
+        dirs[:] = [d for d in dirs if d.lower() not in EXCLUDE_DIRS_LOWER]
+        for name in files:
+            if name in wanted:
+                yield Path(root, name)
+
 
+def _collect_manifests(names: Sequence[str]) -> Dict[str, List[Path]]:
+    # Walk the tree once and bucket every hit by filename.
+    buckets: Dict[str, List[Path]] = {n: [] for n in names}
+    for p in _iter_files(names):
+        buckets[p.name].append(p)
+    return buckets
 
+
+@lru_cache(maxsize=4096)
 def _rel(p: Path) -> str:
     return p.relative_to(REPO_ROOT).as_posix()
 
 
+def _sorted_by_rel(paths: Iterable[Path]) -> List[Tuple[str, Path]]:
+    # Compute each relative key once and hand it back for rendering.
+    return sorted(((_rel(p), p) for p in paths), key=itemgetter(0))
+
+
 def _looks_like_vendored_dependency_tree(p: Path) -> bool:
     # Best-effort heuristic for "copied dependency source".
     rel = _rel(p).lower()
-    return any(
-        seg in rel
-        for seg in (
-            "/vendor/",
-            "/third_party/",
-            "/third-party/",
-            "/3rdparty/",
-            "/deps/",
-            "/dependencies/",
-        )
-    )
+    return any(seg in rel for seg in VENDORED_PATH_SEGMENTS)
 
 
-def _parse_package_json(path: Path) -> Dict[str, Dict[str, str]]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+def _parse_package_json(path: Path) -> Dict[str, Any]:
+    # Keyed on mtime so an edited file is re-parsed; callers must not mutate the result.
+    return _parse_package_json_cached(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _parse_package_json_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    data = json.loads(Path(path_str).read_text(encoding="utf-8"))
     deps = data.get("dependencies") or {}
     dev = data.get("devDependencies") or {}
     peer = data.get("peerDependencies") or {}
@@ -123,10 +189,22 @@ def _parse_package_json(path: Path) -> Dict[str, Dict[str, str]]:
                 out[k] = v
         return out
 
-    return {"dependencies": _to_str_map(deps), "devDependencies": _to_str_map(dev), "peerDependencies": _to_str_map(peer)}
+    # npm/pnpm use a list of globs; yarn also accepts {"packages": [...]}.
+    workspaces = data.get("workspaces")
+    if isinstance(workspaces, dict):
+        workspaces = workspaces.get("packages")
+    if not isinstance(workspaces, list):
+        workspaces = []
+
+    return {
+        "dependencies": _to_str_map(deps),
+        "devDependencies": _to_str_map(dev),
+        "peerDependencies": _to_str_map(peer),
+        "workspaces": [w for w in workspaces if isinstance(w, str)],
+    }
 
 
-def _direct_deps_summary(pkg: Dict[str, Dict[str, str]], *, include_dev: bool = True) -> List[Tuple[str, str, str]]:
+def _direct_deps_summary(pkg: Dict[str, Any], *, include_dev: bool = True) -> List[Tuple[str, str, str]]:
     items: List[Tuple[str, str, str]] = []
     for section in ("dependencies", "peerDependencies"):
         for name, spec in sorted(pkg.get(section, {}).items()):
@@ -138,32 +216,83 @@ def _direct_deps_summary(pkg: Dict[str, Dict[str, str]], *, include_dev: bool =
 
 
 def _has_any_lockfile(dir_path: Path, names: Sequence[str]) -> Optional[Path]:
+    # Stat each candidate: unlike matching a directory listing, this stays case-insensitive
+    # on Windows/macOS, as with the other gates' presence probes.
     for n in names:
         p = dir_path / n
-        if p.exists() and p.is_file():
+        if p.is_file():
             return p
     return None
 
 
+def _pnpm_workspace_globs(path: Path) -> List[str]:
+    # Minimal reader for the `packages:` list of pnpm-workspace.yaml (block or flow style).
+    globs: List[str] = []
+    in_packages = False
+    for raw in path.read_text(encoding="utf-8", errors="replace").splitlines():
+        line = raw.split("#", 1)[0].rstrip()
+        if not line.strip():
+            continue
+        if not raw[:1].isspace():
+            key, _, rest = line.partition(":")
+            in_packages = key.strip() == "packages"
+            rest = rest.strip()
+            if in_packages and rest.startswith("["):
+                globs.extend(x.strip().strip("'\"") for x in rest.strip("[]").split(",") if x.strip())
+            continue
+        item = line.strip()
+        if in_packages and item.startswith("-"):
+            globs.append(item[1:].strip().strip("'\""))
+    return [g for g in globs if g]
+
+
+def _workspace_root(names: Sequence[str]) -> Optional[Tuple[Path, List[str]]]:
+    # (root lockfile, member globs) when the repo root is a pnpm/npm/yarn workspace with a lockfile.
+    root_lock = _has_any_lockfile(REPO_ROOT, names)
+    if root_lock is None:
+        return None
+    pnpm_workspace = REPO_ROOT / "pnpm-workspace.yaml"
+    if pnpm_workspace.is_file():
+        globs = _pnpm_workspace_globs(pnpm_workspace)
+    else:
+        root_pkg = REPO_ROOT / "package.json"
+        if not root_pkg.is_file():
+            return None
+        try:
+            globs = _parse_package_json(root_pkg)["workspaces"]
+        except Exception:
+            return None
+    return (root_lock, globs) if globs else None
+
+
+def _glob_parts_match(pattern: List[str], parts: List[str]) -> bool:
+    if not pattern:
+        return not parts
+    if pattern[0] == "**":
+        return any(_glob_parts_match(pattern[1:], parts[i:]) for i in range(len(parts) + 1))
+    return bool(parts) and fnmatchcase(parts[0], pattern[0]) and _glob_parts_match(pattern[1:], parts[1:])
+
+
+def _is_workspace_member(rel_dir: str, globs: Sequence[str]) -> bool:
+    # Globs match per path segment ("*" never crosses "/"); a later "!glob" excludes again.
+    member = False
+    for g in globs:
+        negated = g.startswith("!")
+        pattern = g[1:] if negated else g
+        pattern = pattern.strip().removeprefix("./").strip("/")
+        if pattern and _glob_parts_match(pattern.split("/"), rel_dir.split("/")):
+            member = not negated
+    return member
+
+
 def _python_req_pinned(req_line: str) -> bool:
-    # Accept strict pins like pkg==1.2.3, pkg===1.2.3. Ignore comments and blanks.
-    line = req_line.strip()
-    if not line or line.startswith("#"):
-        return True
-    if line.startswith("-r ") or line.startswith("--requirement"):
-        return True
-    if line.startswith("--"):
-        return True
-    # allow direct url / git refs as pinned by commit (best effort)
-    if "@" in line and ("git+" in line or "http://" in line or "https://" in line):
-        return True
-    return "==" in line or "===" in line
+    return _PINNED_REQ_RE.match(req_line) is not None
 
 
 def _check_python_requirements_pinned(req_path: Path) -> bool:
-    lines = req_path.read_text(encoding="utf-8", errors="replace").splitlines()
-    # Consider pinned if all non-empty, non-comment entries are pinned.
-    return all(_python_req_pinned(l) for l in lines)
+    # Consider pinned if all non-empty, non-comment entries are pinned; stop at the first offender.
+    with req_path.open("r", encoding="utf-8", errors="replace") as f:
+        return all(_python_req_pinned(l) for l in f)
 
 
 def _detect_node_runtime_proof(package_dir: Path, deps: List[Tuple[str, str, str]]) -> List[str]:
@@ -178,18 +307,28 @@ def _detect_node_runtime_proof(package_dir: Path, deps: List[Tuple[str, str, str
     if not to_check:
         return ["- runtime load-path proof: N/A (no direct dependencies)"]
 
-    node = os.environ.get("NODE", "node")
+    node = shutil.which(os.environ.get("NODE", "node"))
+    if not node:
+        return ["- runtime load-path proof: N/A (node executable not found on PATH)"]
+
+    # Resolve all deps in one Node process; one tab-separated line per dep.
+    rc, out, err = _run([node, "-e", NODE_RESOLVE_SCRIPT, "--", *to_check], cwd=package_dir)
+    if rc != 0:
+        return [f"- runtime load-path proof: resolve FAILED (rc={rc}). stderr: {err.strip()[:200]}"]
+
+    resolved: Dict[str, Tuple[bool, str]] = {}
+    for raw in out.splitlines():
+        parts = raw.split("\t", 2)
+        if len(parts) == 3:
+            resolved[parts[0]] = (parts[1] == "OK", parts[2])
+
     lines: List[str] = ["- runtime load-path proof:"]
     for name in to_check:
-        # Use node -p require.resolve; capture path.
-        cmd = f'{node} -p "require.resolve(\"{name}\")"'
-        rc, out, err = _run_shell(cmd, cwd=package_dir)
-        if rc == 0:
-            lines.append(f"  - `{name}` resolved to `{out.strip()}`")
+        ok, detail = resolved.get(name, (False, "no output from resolver"))
+        if ok:
+            lines.append(f"  - `{name}` resolved to `{detail.strip()}`")
         else:
-            lines.append(
-                f"  - `{name}` resolve FAILED (rc={rc}). stderr: {err.strip()[:200]}"
-            )
+            lines.append(f"  - `{name}` resolve FAILED: {detail.strip()[:200]}")
     return lines
 
 
@@ -199,13 +338,10 @@ def _detect_python_runtime_proof() -> List[str]:
     return ["- runtime load-path proof: N/A (no Python dependency environment inspection in this repo state)"]
 
 
-def _run_shell(command: str, *, cwd: Path) -> Tuple[int, str, str]:
-    import subprocess
-
+def _run(argv: Sequence[str], *, cwd: Path) -> Tuple[int, str, str]:
     completed = subprocess.run(
-        command,
+        list(argv),
         cwd=str(cwd),
-        shell=True,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
@@ -226,11 +362,11 @@ def _audit_flutter(pubspec_paths: List[Path]) -> Tuple[List[str], List[Violation
         lines.append("")
         return lines, violations
 
-    for p in sorted(pubspec_paths, key=_rel):
+    for rel, p in _sorted_by_rel(pubspec_paths):
         d = p.parent
         lock = d / "pubspec.lock"
         ok = lock.exists()
-        lines.append(f"### { _rel(p) }")
+        lines.append(f"### {rel}")
         lines.append(f"- conclusion: {'PASS' if ok else 'FAIL'}")
         lines.append(f"- evidence: pubspec.lock {'present' if ok else 'missing'} at `{_rel(lock)}`")
         lines.append(
@@ -241,7 +377,7 @@ def _audit_flutter(pubspec_paths: List[Path]) -> Tuple[List[str], List[Violation
             violations.append(
                 Violation(
                     kind="missing_lockfile",
-                    path=_rel(p),
+                    path=rel,
                     details="Flutter project has pubspec.yaml but missing pubspec.lock",
                 )
             )
@@ -263,14 +399,30 @@ def _audit_node(package_json_paths: List[Path]) -> Tuple[List[str], List[Violati
 
     lock_candidates = ["package-lock.json", "pnpm-lock.yaml", "yarn.lock"]
 
-    for p in sorted(package_json_paths, key=_rel):
+    projects = _sorted_by_rel(package_json_paths)
+    deps_by_project = {p: _direct_deps_summary(_parse_package_json(p)) for _, p in projects}
+
+    # Runtime proofs are dominated by node process startup; run projects concurrently
+    # and render in sorted order below.
+    with ThreadPoolExecutor(max_workers=min(8, len(projects))) as pool:
+        proof_futures = {
+            p: pool.submit(_detect_node_runtime_proof, p.parent, deps) for p, deps in deps_by_project.items()
+        }
+
+    workspace = _workspace_root(lock_candidates)
+
+    for rel, p in projects:
         d = p.parent
-        lock = _has_any_lockfile(d, lock_candidates)
+        rel_dir = rel.rpartition("/")[0]
+        if workspace is not None and rel_dir and _is_workspace_member(rel_dir, workspace[1]):
+            # Covered by the workspace root lockfile; no per-member probe needed.
+            lock = workspace[0]
+        else:
+            lock = _has_any_lockfile(d, lock_candidates)
         ok = lock is not None
-        pkg = _parse_package_json(p)
-        deps = _direct_deps_summary(pkg)
+        deps = deps_by_project[p]
 
-        lines.append(f"### { _rel(p) }")
+        lines.append(f"### {rel}")
         lines.append(f"- conclusion: {'PASS' if ok else 'FAIL'}")
         lines.append(
             f"- evidence: lockfile {'present: `' + _rel(lock) + '`' if lock else 'missing (expected one of: ' + ', '.join(lock_candidates) + ')'}"
@@ -280,20 +432,19 @@ def _audit_node(package_json_paths: List[Path]) -> Tuple[List[str], List[Violati
         )
         lines.append("- direct dependencies (from package.json):")
         if deps:
-            for section, name, spec in deps:
-                lines.append(f"  - `{name}` ({section}): `{spec}`")
+            lines.extend(f"  - `{name}` ({section}): `{spec}`" for section, name, spec in deps)
         else:
             lines.append("  - (none)")
 
         # Runtime proof (best-effort)
-        lines.extend(_detect_node_runtime_proof(d, deps))
+        lines.extend(proof_futures[p].result())
         lines.append("")
 
         if not ok:
             violations.append(
                 Violation(
                     kind="missing_lockfile",
-                    path=_rel(p),
+                    path=rel,
                     details="Node project has package.json but missing lockfile",
                 )
             )
@@ -301,15 +452,14 @@ def _audit_node(package_json_paths: List[Path]) -> Tuple[List[str], List[Violati
     return lines, violations
 
 
-def _audit_python() -> Tuple[List[str], List[Violation]]:
+def _audit_python(manifests: Dict[str, List[Path]]) -> Tuple[List[str], List[Violation]]:
     lines: List[str] = []
     violations: List[Violation] = []
 
     lines.append("## Python (FastAPI)")
 
-    req_paths = list(_iter_files(["requirements.txt", "requirements.lock"]))
-    pyproject_paths = list(_iter_files(["pyproject.toml"]))
-    lock_paths = list(_iter_files(["poetry.lock", "pdm.lock", "uv.lock"]))
+    req_paths = manifests["requirements.txt"] + manifests["requirements.lock"]
+    pyproject_paths = manifests["pyproject.toml"]
 
     if not req_paths and not pyproject_paths:
         lines.append("- conclusion: N/A (no requirements.txt or pyproject.toml found)")
@@ -319,9 +469,9 @@ def _audit_python() -> Tuple[List[str], List[Violation]]:
         return lines, violations
 
     # requirements.txt
-    for p in sorted(req_paths, key=_rel):
+    for rel, p in _sorted_by_rel(req_paths):
         pinned = _check_python_requirements_pinned(p)
-        lines.append(f"### { _rel(p) }")
+        lines.append(f"### {rel}")
         lines.append(f"- conclusion: {'PASS' if pinned else 'FAIL'}")
         lines.append(f"- evidence: requirements entries {'all pinned (==/===) or equivalent' if pinned else 'contain unpinned specs'}")
         lines.append(
@@ -333,27 +483,29 @@ def _audit_python() -> Tuple[List[str], List[Violation]]:
             violations.append(
                 Violation(
                     kind="unpinned_python_requirements",
-                    path=_rel(p),
+                    path=rel,
                     details="Python requirements.txt contains unpinned dependency spec(s)",
                 )
             )
 
     # pyproject + lock
-    for p in sorted(pyproject_paths, key=_rel):
+    # Lockfiles by directory, in preference order (poetry, pdm, uv); only indexed when a
+    # pyproject.toml needs one.
+    lock_by_dir: Dict[Path, List[Path]] = defaultdict(list)
+    if pyproject_paths:
+        for n in PYTHON_LOCK_NAMES:
+            for lp in manifests[n]:
+                lock_by_dir[lp.parent].append(lp)
+
+    for rel, p in _sorted_by_rel(pyproject_paths):
         d = p.parent
-        has_lock = any((d / n).exists() for n in ("poetry.lock", "pdm.lock", "uv.lock")) or bool(
-            [lp for lp in lock_paths if lp.parent == d]
-        )
-        lines.append(f"### { _rel(p) }")
+        locks = lock_by_dir.get(d, [])
+        has_lock = bool(locks)
+        lines.append(f"### {rel}")
         lines.append(f"- conclusion: {'PASS' if has_lock else 'FAIL'}")
         if has_lock:
-            # pick one lockfile name
-            lf = None
-            for n in ("poetry.lock", "pdm.lock", "uv.lock"):
-                if (d / n).exists():
-                    lf = d / n
-                    break
-            lines.append(f"- evidence: lockfile present: `{_rel(lf)}`" if lf else "- evidence: lockfile present")
+            lf = locks[0]
+            lines.append(f"- evidence: lockfile present: `{_rel(lf)}`")
             lines.append("- risk: locked dependency set supports reproducible installs")
         else:
             lines.append("- evidence: missing lockfile next to pyproject.toml (expected poetry.lock/pdm.lock/uv.lock)")
@@ -363,7 +515,7 @@ def _audit_python() -> Tuple[List[str], List[Violation]]:
             violations.append(
                 Violation(
                     kind="missing_lockfile",
-                    path=_rel(p),
+                    path=rel,
                     details="pyproject.toml found but no lockfile present",
                 )
             )
@@ -375,25 +527,28 @@ def _audit_python() -> Tuple[List[str], List[Violation]]:
 
 def main(argv: Sequence[str]) -> int:
     try:
+        manifests = _collect_manifests(SCANNED_FILE_NAMES)
+
         # Detect vendored folders (best-effort)
-        vendored_hits = [p for p in _iter_files(["README.md"]) if _looks_like_vendored_dependency_tree(p)]
+        vendored_hits = [p for p in manifests["README.md"] if _looks_like_vendored_dependency_tree(p)]
         # The above is intentionally light; we'll only report it, not fail by default.
 
-        pubspec_paths = list(_iter_files(["pubspec.yaml"]))
-        package_json_paths = list(_iter_files(["package.json"]))
-
-        md: List[str] = []
-        md.append("# dependency-audit.md")
-        md.append("")
-        md.append("This file is produced by Gate 4 (Dependency Integrity) automation.")
-        md.append("")
-        md.append("## Inputs")
-        md.append(f"- timestamp_utc: `{_utc_now()}`")
-        md.append("")
-        md.append("## Summary")
-        md.append("- policy source: `memory_bank/implementation-plan.md` section 4")
-        md.append("- note: this repo may not have code roots yet; N/A is allowed in that phase")
-        md.append("")
+        pubspec_paths = manifests["pubspec.yaml"]
+        package_json_paths = manifests["package.json"]
+
+        md: List[str] = [
+            "# dependency-audit.md",
+            "",
+            "This file is produced by Gate 4 (Dependency Integrity) automation.",
+            "",
+            "## Inputs",
+            f"- timestamp_utc: `{_utc_now()}`",
+            "",
+            "## Summary",
+            "- policy source: `memory_bank/implementation-plan.md` section 4",
+            "- note: this repo may not have code roots yet; N/A is allowed in that phase",
+            "",
+        ]
 
         all_violations: List[Violation] = []
 
@@ -405,7 +560,7 @@ def main(argv: Sequence[str]) -> int:
         md.extend(part)
         all_violations.extend(v)
 
-        part, v = _audit_python()
+        part, v = _audit_python(manifests)
         md.extend(part)
         all_violations.extend(v)
 
@@ -413,8 +568,7 @@ def main(argv: Sequence[str]) -> int:
         if all_violations:
             md.append("- overall: FAIL")
             md.append("- violations:")
-            for vv in all_violations:
-                md.append(f"  - [{vv.kind}] `{vv.path}`: {vv.details}")
+            md.extend(f"  - [{vv.kind}] `{vv.path}`: {vv.details}" for vv in all_violations)
         else:
             md.append("- overall: PASS")
             md.append("- violations: (none)")
@@ -425,8 +579,7 @@ def main(argv: Sequence[str]) -> int:
             md.append(
                 "- vendored dependency tree indicators were found (please check if any third-party source was copied into repo):"
             )
-            for p in sorted(vendored_hits, key=_rel)[:20]:
-                md.append(f"  - `{_rel(p)}`")
+            md.extend(f"  - `{rel}`" for rel, _ in _sorted_by_rel(vendored_hits)[:20])
 
         md.append("")
         _write_report("\n".join(md) + "\n")
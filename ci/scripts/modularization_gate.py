@@ -36,10 +36,10 @@ import json
 import os
 import re
 import sys
-from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence, Tuple
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -48,6 +48,7 @@ REPORT_JSON_PATH = ARTIFACTS_DIR / "modularization-report.json"
 
 DEFAULT_SCAN_ROOTS = ["apps", "services"]
 BUSINESS_EXTS = {".dart", ".ts", ".py"}
+BUSINESS_SUFFIXES = tuple(sorted(BUSINESS_EXTS))
 
 MANIFEST_RELS = [
     "pubspec.yaml",
@@ -57,21 +58,12 @@ MANIFEST_RELS = [
 ]
 
 # Exclusions aligned with implementation-plan.md 0.4 and Gate 3.
-EXCLUDE_DIR_PATTERNS = [
-    re.compile(r"(^|/)generated(/|$)", re.IGNORECASE),
-    re.compile(r"(^|/)build(/|$)", re.IGNORECASE),
-    re.compile(r"(^|/)dist(/|$)", re.IGNORECASE),
-    re.compile(r"(^|/)node_modules(/|$)", re.IGNORECASE),
-    re.compile(r"(^|/)\.dart_tool(/|$)", re.IGNORECASE),
-    re.compile(r"(^|/)\.venv(/|$)", re.IGNORECASE),
-    re.compile(r"(^|/)__pycache__(/|$)", re.IGNORECASE),
-]
+# One alternation per kind, so each path costs two regex searches.
+EXCLUDE_DIR_RE = re.compile(
+    r"(^|/)(generated|build|dist|node_modules|\.dart_tool|\.venv|__pycache__)(/|$)", re.IGNORECASE
+)
 
-EXCLUDE_FILE_PATTERNS = [
-    re.compile(r"\.g\.dart$", re.IGNORECASE),
-    re.compile(r"\.d\.ts$", re.IGNORECASE),
-    re.compile(r"\.pb\.[^/]+$", re.IGNORECASE),
-]
+EXCLUDE_FILE_RE = re.compile(r"(\.g\.dart|\.d\.ts|\.pb\.[^/]+)$", re.IGNORECASE)
 
 # Conservative "anti-common-layer" signal directories.
 # We DO NOT ban all utils/common globally forever; we only flag in business roots.
@@ -88,18 +80,37 @@ BANNED_VENDOR_DIR_NAMES = {
     "third-party",
 }
 
+# Single membership test per directory; the rule is only disambiguated on a hit.
+BANNED_DIR_NAMES = frozenset(BANNED_GENERAL_LAYER_DIR_NAMES | BANNED_VENDOR_DIR_NAMES)
+
+BANNED_DIR_MESSAGES = {
+    "no_general_shared_layer": (
+        "Found a generic shared layer directory. "
+        "Step 9 forbids building a self-made general layer; prefer mature deps "
+        "or keep code within a bounded module."
+    ),
+    "no_vendored_dependency_source": (
+        "Found a vendored/third-party source directory. "
+        "This is a common sign of copying dependency code into the repo, "
+        "which violates dependency integrity/blackbox principles unless explicitly audited."
+    ),
+}
+
 
-@dataclass
-class Finding:
+class Finding(NamedTuple):
     rule: str
     path: str
     message: str
 
 
+@lru_cache(maxsize=1)
+def _utc_now() -> str:
+    # Cached: the report and the error fallback share one value.
+    return datetime.now(timezone.utc).isoformat()
+
+
 def _is_excluded(rel_posix: str) -> bool:
-    return any(rx.search(rel_posix) for rx in EXCLUDE_DIR_PATTERNS) or any(
-        rx.search(rel_posix) for rx in EXCLUDE_FILE_PATTERNS
-    )
+    return bool(EXCLUDE_DIR_RE.search(rel_posix) or EXCLUDE_FILE_RE.search(rel_posix))
 
 
 def _parse_roots(argv: Sequence[str]) -> List[str]:
@@ -119,20 +130,32 @@ def _parse_roots(argv: Sequence[str]) -> List[str]:
     return roots if roots else list(DEFAULT_SCAN_ROOTS)
 
 
-def _iter_business_files(scan_roots: List[str]) -> Iterable[Path]:
+def _walk_scan_roots(scan_roots: List[str]) -> Iterable[Tuple[str, List[str], List[str]]]:
+    # Top-down walk of each scan root; excluded directories are pruned before descent.
     for root in scan_roots:
         root_path = REPO_ROOT / root
-        if not root_path.exists() or not root_path.is_dir():
+        if not root_path.is_dir() or EXCLUDE_DIR_RE.search(root):
             continue
-        for p in root_path.rglob("*"):
-            if not p.is_file():
-                continue
-            rel = p.relative_to(REPO_ROOT).as_posix()
-            if _is_excluded(rel):
-                continue
-            if p.suffix.lower() not in BUSINESS_EXTS:
-                continue
-            yield p
+        # Relative paths are built from a per-root prefix; no Path objects per entry.
+        root_abs = str(root_path)
+        # The repo root itself ("--roots .") gets an empty prefix, not "./".
+        root_rel = root_path.relative_to(REPO_ROOT).as_posix()
+        if root_rel == ".":
+            root_rel = ""
+        for dirpath, dirnames, filenames in os.walk(root_abs):
+            sub = dirpath[len(root_abs):].replace(os.sep, "/")
+            rel_dir = root_rel + sub if root_rel else sub[1:]
+            dirnames[:] = [d for d in dirnames if not EXCLUDE_DIR_RE.search(_join_rel(rel_dir, d))]
+            yield rel_dir, dirnames, filenames
+
+
+def _join_rel(rel_dir: str, name: str) -> str:
+    return f"{rel_dir}/{name}" if rel_dir else name
+
+
+def _is_business_file(rel_dir: str, name: str) -> bool:
+    # Cheap suffix test first; the exclusion regexes only run on candidate files.
+    return name.lower().endswith(BUSINESS_SUFFIXES) and not _is_excluded(_join_rel(rel_dir, name))
 
 
 def _manifest_presence() -> Dict[str, bool]:
@@ -143,54 +166,28 @@ def _has_any_manifest(presence: Dict[str, bool]) -> bool:
     return any(presence.values())
 
 
-def _has_any_business_code(scan_roots: List[str]) -> bool:
-    return any(True for _ in _iter_business_files(scan_roots))
-
-
-def _scan_banned_directories(scan_roots: List[str]) -> List[Finding]:
+def _scan_business_roots(scan_roots: List[str]) -> Tuple[bool, List[Finding]]:
+    """Single walk: detect business code and collect banned-directory findings."""
+    has_business = False
     findings: List[Finding] = []
 
-    # We walk directories under scan roots and flag on directory-name matches.
-    for root in scan_roots:
-        root_path = REPO_ROOT / root
-        if not root_path.exists() or not root_path.is_dir():
-            continue
+    for rel_dir, dirnames, filenames in _walk_scan_roots(scan_roots):
+        has_business = has_business or any(_is_business_file(rel_dir, n) for n in filenames)
 
-        for p in root_path.rglob("*"):
-            if not p.is_dir():
-                continue
-            rel = p.relative_to(REPO_ROOT).as_posix()
+        # Flag on directory-name matches.
+        for d in dirnames:
+            rel = _join_rel(rel_dir, d)
             if _is_excluded(rel):
                 continue
 
-            name = p.name.lower()
-            if name in BANNED_GENERAL_LAYER_DIR_NAMES:
-                findings.append(
-                    Finding(
-                        rule="no_general_shared_layer",
-                        path=rel,
-                        message=(
-                            "Found a generic shared layer directory. "
-                            "Step 9 forbids building a self-made general layer; prefer mature deps "
-                            "or keep code within a bounded module."
-                        ),
-                    )
-                )
-
-            if name in BANNED_VENDOR_DIR_NAMES:
-                findings.append(
-                    Finding(
-                        rule="no_vendored_dependency_source",
-                        path=rel,
-                        message=(
-                            "Found a vendored/third-party source directory. "
-                            "This is a common sign of copying dependency code into the repo, "
-                            "which violates dependency integrity/blackbox principles unless explicitly audited."
-                        ),
-                    )
-                )
-
-    return findings
+            name = d.lower()
+            if name not in BANNED_DIR_NAMES:
+                continue
+            rule = "no_general_shared_layer" if name in BANNED_GENERAL_LAYER_DIR_NAMES else "no_vendored_dependency_source"
+            findings.append(Finding(rule=rule, path=rel, message=BANNED_DIR_MESSAGES[rule]))
+
+    findings.sort(key=lambda f: (f.path, f.rule))
+    return has_business, findings
 
 
 def _write_report(*, report: Dict[str, Any]) -> None:
@@ -202,16 +199,14 @@ def main(argv: List[str]) -> int:
     scan_roots = _parse_roots(argv)
     manifest_presence = _manifest_presence()
     any_manifest = _has_any_manifest(manifest_presence)
-    any_business = _has_any_business_code(scan_roots)
+    any_business, banned_findings = _scan_business_roots(scan_roots)
 
-    utc_now = datetime.now(timezone.utc).isoformat()
+    utc_now = _utc_now()
 
     # Early repo: no manifest and no business code under roots => N/A pass.
     is_na = (not any_manifest) and (not any_business)
 
-    findings: List[Finding] = []
-    if not is_na:
-        findings = _scan_banned_directories(scan_roots)
+    findings: List[Finding] = [] if is_na else banned_findings
 
     overall_ok = len(findings) == 0
 
@@ -265,7 +260,7 @@ if __name__ == "__main__":
     except Exception as e:
         # Still try to write an error report.
         try:
-            utc_now = datetime.now(timezone.utc).isoformat()
+            utc_now = _utc_now()
             _write_report(
                 report={
                     "timestamp_utc": utc_now,
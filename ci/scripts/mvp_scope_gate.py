@@ -47,10 +47,10 @@ import json
 import os
 import subprocess
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -59,7 +59,7 @@ REPORT_JSON_PATH = ARTIFACTS_DIR / "mvp-scope-report.json"
 RULES_PATH = REPO_ROOT / "ci" / "mvp-scope-rules.yml"
 
 DEFAULT_MAX_FILE_BYTES = 300_000
-CODE_EXTS = {".dart", ".ts", ".py"}
+CODE_EXTS = frozenset({".dart", ".ts", ".py"})
 
 # Exclude gate/tooling/docs areas from *content* scanning to avoid self-trigger.
 CONTENT_EXCLUDE_PREFIXES = (
@@ -67,10 +67,12 @@ CONTENT_EXCLUDE_PREFIXES = (
     "memory_bank/",
     "ci_artifacts/",
 )
+CONTENT_EXCLUDE_PREFIXES_LOWER = tuple(p.lower() for p in CONTENT_EXCLUDE_PREFIXES)
+# Same window git uses to classify a blob as binary.
+BINARY_PEEK_BYTES = 8000
 
 
-@dataclass
-class MatchEvidence:
+class MatchEvidence(NamedTuple):
     keyword: str
     target: str  # path/content
     file: str
@@ -82,19 +84,18 @@ def _utc_now() -> str:
 
 
 def _run_git(args: Sequence[str]) -> str:
+    # Decode ourselves; text mode would translate newlines inside -z output.
     completed = subprocess.run(
         ["git", *args],
         cwd=str(REPO_ROOT),
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
         check=False,
     )
     if completed.returncode != 0:
-        raise RuntimeError(
-            f"git {' '.join(args)} failed (code {completed.returncode}): {completed.stderr.strip()}"
-        )
-    return completed.stdout
+        stderr = completed.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"git {' '.join(args)} failed (code {completed.returncode}): {stderr}")
+    return completed.stdout.decode("utf-8", errors="surrogateescape")
 
 
 def _guess_base_head() -> Tuple[Optional[str], Optional[str]]:
@@ -105,27 +106,64 @@ def _guess_base_head() -> Tuple[Optional[str], Optional[str]]:
     return None, None
 
 
-def _changed_files(base: Optional[str], head: Optional[str]) -> List[str]:
+def _changed_files(base: Optional[str], head: Optional[str]) -> Tuple[List[str], Set[str]]:
+    """Return (all changed paths, the subset deleted in the change set)."""
+    # -z: unquoted, "/"-separated paths.
+    files: Set[str] = set()
+    deleted: Set[str] = set()
     if base and head:
-        out = _run_git(["diff", "--name-only", f"{base}...{head}"])
-        files = [line.strip().replace("\\", "/") for line in out.splitlines() if line.strip()]
-        return sorted(set(files))
-
-    out = _run_git(["status", "--porcelain"])
-    files: List[str] = []
-    for line in out.splitlines():
-        if not line.strip():
+        out = _run_git(["diff", "--name-status", "-z", f"{base}...{head}"])
+        records = iter(out.split("\0"))
+        for status in records:
+            if not status:
+                continue
+            path = next(records, "")
+            # Renames/copies carry the original path first; keep only the new one.
+            if status[0] in "RC":
+                path = next(records, "")
+            if not path:
+                continue
+            files.add(path)
+            if status[0] == "D":
+                deleted.add(path)
+        return sorted(files), deleted
+
+    out = _run_git(["status", "--porcelain", "-z"])
+    present: Set[str] = set()
+    records = iter(out.split("\0"))
+    for rec in records:
+        if len(rec) < 4:
             continue
-        path = line[3:].strip()
-        if path:
-            files.append(path.replace("\\", "/"))
-    return sorted(set(files))
+        xy, path = rec[:2], rec[3:]
+        files.add(path)
+        # Unmerged entries (any "U") still have a worktree file to scan.
+        if "D" in xy and "U" not in xy:
+            deleted.add(path)
+        else:
+            present.add(path)
+        # A rename/copy in either XY column is followed by its original path; skip that record.
+        if "R" in xy or "C" in xy:
+            next(records, None)
+    # A staged deletion can be listed again as untracked ("??") when the file was re-created.
+    return sorted(files), deleted - present
+
+
+def _suffix_lower(posix_path: str) -> str:
+    # Same result as Path(posix_path).suffix.lower(), without building a Path.
+    name = posix_path.rpartition("/")[2]
+    i = name.rfind(".")
+    return name[i:].lower() if 0 < i < len(name) - 1 else ""
 
 
 def _rel(p: Path) -> str:
     return p.relative_to(REPO_ROOT).as_posix()
 
 
+def _display_path(posix_path: str) -> str:
+    # Non-UTF-8 names arrive as lone surrogates (still usable for reads); escape them for the report.
+    return posix_path.encode("utf-8", "surrogateescape").decode("utf-8", "backslashreplace")
+
+
 def _is_probably_text(data: bytes) -> bool:
     # Best-effort heuristic: reject NUL bytes.
     return b"\x00" not in data
@@ -205,37 +243,37 @@ def _write_report(report: Dict[str, Any]) -> None:
     )
 
 
-def _scan_file_content(
+def _read_text_for_scan(
     *,
     abs_path: Path,
-    keyword: str,
     case_insensitive: bool,
     max_bytes: int,
-) -> Optional[str]:
-    if not abs_path.exists() or not abs_path.is_file():
-        return None
+) -> Optional[Tuple[str, str]]:
+    """Read a file once for content scanning; return (text, haystack) or None if skipped."""
+    # One bounded read replaces the exists/is_file/stat probes; missing paths and
+    # directories surface as OSError, oversized files as reading past max_bytes.
     try:
-        size = abs_path.stat().st_size
-        if size > max_bytes:
+        with abs_path.open("rb") as f:
+            # Peek one block first so most binaries are rejected before the full read.
+            head = f.read(min(BINARY_PEEK_BYTES, max_bytes + 1))
+            if not _is_probably_text(head):
+                return None
+            data = head + f.read(max_bytes + 1 - len(head))
+        if len(data) > max_bytes:
             return None
-        data = abs_path.read_bytes()
         if not _is_probably_text(data):
             return None
         text = data.decode("utf-8", errors="replace")
     except Exception:
         return None
 
-    haystack = text.lower() if case_insensitive else text
-    needle = keyword.lower() if case_insensitive else keyword
+    return text, (text.lower() if case_insensitive else text)
 
-    idx = haystack.find(needle)
-    if idx < 0:
-        return None
 
+def _snippet(text: str, idx: int, keyword: str) -> str:
     start = max(0, idx - 80)
     end = min(len(text), idx + len(keyword) + 80)
-    snippet = text[start:end].replace("\n", "\\n")
-    return snippet
+    return text[start:end].replace("\n", "\\n")
 
 
 def main(argv: Sequence[str]) -> int:
@@ -256,59 +294,88 @@ def main(argv: Sequence[str]) -> int:
         max_file_bytes = int(rules.get("max_file_bytes", DEFAULT_MAX_FILE_BYTES))
 
         base, head = _guess_base_head()
-        changed = _changed_files(base, head)
+        changed, deleted = _changed_files(base, head)
 
-        changed_code_files = [f for f in changed if Path(f).suffix.lower() in CODE_EXTS]
+        changed_code_files = [f for f in changed if _suffix_lower(f) in CODE_EXTS]
         docs_only = len(changed_code_files) == 0
 
         evidences: List[MatchEvidence] = []
 
-        if hard_fail_keywords and changed:
-            for f in changed:
-                posix_path = f.replace("\\", "/")
+        # (keyword, needle) pairs; needles are lowered once when matching is case-insensitive.
+        keywords = [
+            (kw.strip(), kw.strip().lower() if case_insensitive else kw.strip())
+            for kw in hard_fail_keywords
+            if isinstance(kw, str) and kw.strip()
+        ]
+
+        scan_path = "path" in targets
+        scan_content = "content" in targets
+
+        if keywords and changed:
+            # Pass 1: per-file invariants, and which files still need a content read.
+            # Deleted files stay in the report's changed_files but are not scanned.
+            plans: List[Tuple[str, Path, str, bool]] = []
+            for posix_path in changed:
+                if posix_path in deleted:
+                    continue
                 abs_path = REPO_ROOT / Path(posix_path)
-                is_code_file = Path(posix_path).suffix.lower() in CODE_EXTS
-                excluded_from_content = posix_path.lower().startswith(
-                    tuple(p.lower() for p in CONTENT_EXCLUDE_PREFIXES)
+                is_code_file = _suffix_lower(posix_path) in CODE_EXTS
+                posix_lower = posix_path.lower()
+                excluded_from_content = posix_lower.startswith(CONTENT_EXCLUDE_PREFIXES_LOWER)
+                path_hay = posix_lower if case_insensitive else posix_path
+                # Content scan (only for business code files to reduce false positives on docs/tooling),
+                # and only if some keyword was not already matched on the path.
+                needs_content = (
+                    scan_content
+                    and is_code_file
+                    and not excluded_from_content
+                    and not (scan_path and all(needle in path_hay for _, needle in keywords))
                 )
-
-                for kw in hard_fail_keywords:
-                    if not isinstance(kw, str) or not kw.strip():
-                        continue
-                    keyword = kw.strip()
-
+                plans.append((posix_path, abs_path, path_hay, needs_content))
+
+            # Reads are I/O bound; run them concurrently. Each file is read and lowered once.
+            to_read = [abs_path for _, abs_path, _, needs_content in plans if needs_content]
+            contents: Dict[Path, Optional[Tuple[str, str]]] = {}
+            if to_read:
+                with ThreadPoolExecutor(max_workers=min(8, len(to_read))) as pool:
+                    loaded = pool.map(
+                        lambda ap: _read_text_for_scan(
+                            abs_path=ap, case_insensitive=case_insensitive, max_bytes=max_file_bytes
+                        ),
+                        to_read,
+                    )
+                    contents = dict(zip(to_read, loaded))
+
+            # Pass 2: match in the original (file, keyword) order.
+            for posix_path, abs_path, path_hay, needs_content in plans:
+                content = contents.get(abs_path) if needs_content else None
+
+                for keyword, needle in keywords:
                     # Path scan (always)
-                    if "path" in targets:
-                        hay = posix_path.lower() if case_insensitive else posix_path
-                        needle = keyword.lower() if case_insensitive else keyword
-                        if needle in hay:
-                            evidences.append(
-                                MatchEvidence(
-                                    keyword=keyword,
-                                    target="path",
-                                    file=posix_path,
-                                    sample=posix_path,
-                                )
+                    if scan_path and needle in path_hay:
+                        evidences.append(
+                            MatchEvidence(
+                                keyword=keyword,
+                                target="path",
+                                file=_display_path(posix_path),
+                                sample=_display_path(posix_path),
                             )
-                            continue
-
-                    # Content scan (only for business code files to reduce false positives on docs/tooling)
-                    if "content" in targets and is_code_file and not excluded_from_content:
-                        snippet = _scan_file_content(
-                            abs_path=abs_path,
-                            keyword=keyword,
-                            case_insensitive=case_insensitive,
-                            max_bytes=max_file_bytes,
                         )
-                        if snippet is not None:
-                            evidences.append(
-                                MatchEvidence(
-                                    keyword=keyword,
-                                    target="content",
-                                    file=posix_path,
-                                    sample=snippet,
-                                )
+                        continue
+
+                    if content is None:
+                        continue
+                    text, haystack = content
+                    idx = haystack.find(needle)
+                    if idx >= 0:
+                        evidences.append(
+                            MatchEvidence(
+                                keyword=keyword,
+                                target="content",
+                                file=_display_path(posix_path),
+                                sample=_snippet(text, idx, keyword),
                             )
+                        )
 
         if not changed:
             conclusion = "N/A"
@@ -333,8 +400,8 @@ def main(argv: Sequence[str]) -> int:
             "rules_path": _rel(RULES_PATH),
             "base_sha": base,
             "head_sha": head,
-            "changed_files": changed,
-            "changed_code_files": changed_code_files,
+            "changed_files": [_display_path(f) for f in changed],
+            "changed_code_files": [_display_path(f) for f in changed_code_files],
             "conclusion": conclusion,
             "overall_ok": overall_ok,
             "summary": summary,
@@ -34,11 +34,13 @@ Notes:
 
 from __future__ import annotations
 
+import os
+import subprocess
 import sys
-from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -49,22 +51,10 @@ CORRELATION_HEADER = "x-correlation-id"
 CORRELATION_FIELD = "correlation_id"
 DEFAULT_BUSINESS_FIELDS = ["class_session_id"]
 
+MANIFEST_NAMES = ("pubspec.yaml", "package.json", "requirements.txt", "pyproject.toml")
 
-@dataclass
-class CheckResult:
-    name: str
-    ok: bool
-    conclusion: str  # PASS/FAIL/N/A
-    evidence: str
-    risk: str
-
-
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
-
-
-def _iter_files_by_name(name: str) -> List[Path]:
-    exclude_dirs = {
+EXCLUDE_DIRS_LOWER = frozenset(
+    {
         ".git",
         ".idea",
         "ci_artifacts",
@@ -76,21 +66,70 @@ def _iter_files_by_name(name: str) -> List[Path]:
         ".venv",
         "__pycache__",
     }
-    hits: List[Path] = []
-    for p in REPO_ROOT.rglob(name):
-        parts = {x.lower() for x in p.parts}
-        if any(ed.lower() in parts for ed in exclude_dirs):
-            continue
-        if p.is_file() and p.name == name:
-            hits.append(p)
-    return sorted(hits, key=lambda x: x.relative_to(REPO_ROOT).as_posix())
+)
+
+
+class CheckResult(NamedTuple):
+    name: str
+    ok: bool
+    conclusion: str  # PASS/FAIL/N/A
+    evidence: str
+    risk: str
+
+
+@lru_cache(maxsize=1)
+def _utc_now() -> str:
+    # Cached so every output of a run agrees.
+    return datetime.now(timezone.utc).isoformat()
+
+
+@lru_cache(maxsize=1)
+def _git_listed_files() -> Optional[Tuple[str, ...]]:
+    """Tracked + untracked (non-ignored) repo files from git's index, or None outside a checkout."""
+    try:
+        completed = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=str(REPO_ROOT),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+    except OSError:
+        return None
+    if completed.returncode != 0:
+        return None
+    return tuple(p for p in completed.stdout.decode("utf-8", errors="surrogateescape").split("\0") if p)
+
+
+def _iter_hits(names: Sequence[str]) -> Iterable[Path]:
+    """Lazily yield repo files whose basename is in `names` (unordered)."""
+    wanted = frozenset(names)
+    listed = _git_listed_files()
+    if listed is not None:
+        for rel in listed:
+            head, _, base = rel.rpartition("/")
+            if base not in wanted:
+                continue
+            if any(part.lower() in EXCLUDE_DIRS_LOWER for part in head.split("/")):
+                continue
+            p = REPO_ROOT / rel
+            if p.is_file():
+                yield p
+        return
+
+    # Not a git checkout: walk the tree once; excluded subtrees are never entered.
+    for root, dirs, files in os.walk(REPO_ROOT, followlinks=False):
+        dirs[:] = [d for d in dirs if d.lower() not in EXCLUDE_DIRS_LOWER]
+        for name in files:
+            if name in wanted:
+                p = Path(root, name)
+                if p.is_file():
+                    yield p
 
 
 def _has_any_manifest() -> bool:
-    return any(
-        _iter_files_by_name(n)
-        for n in ("pubspec.yaml", "package.json", "requirements.txt", "pyproject.toml")
-    )
+    # Stop at the first manifest of any kind.
+    return next(iter(_iter_hits(MANIFEST_NAMES)), None) is not None
 
 
 def _write_evidence(*, checks: List[CheckResult], overall_ok: bool) -> None:
@@ -122,7 +161,14 @@ def _write_evidence(*, checks: List[CheckResult], overall_ok: bool) -> None:
     lines.append(f"- overall_ok: `{str(overall_ok).lower()}`")
     lines.append("")
 
-    TRACE_EVIDENCE_PATH.write_text("\n".join(lines), encoding="utf-8")
+    # Also the next run's input; swap it in whole or not at all.
+    tmp_path = TRACE_EVIDENCE_PATH.with_suffix(".md.tmp")
+    try:
+        tmp_path.write_text("\n".join(lines), encoding="utf-8")
+        os.replace(tmp_path, TRACE_EVIDENCE_PATH)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def _check_minimal_evidence() -> CheckResult:
@@ -139,7 +185,10 @@ def _check_minimal_evidence() -> CheckResult:
         )
 
     # If code exists, require evidence file to already exist and contain required tokens.
-    if not TRACE_EVIDENCE_PATH.exists():
+    # Read directly instead of probing with exists() first: one open covers both.
+    try:
+        text = TRACE_EVIDENCE_PATH.read_text(encoding="utf-8", errors="replace")
+    except FileNotFoundError:
         return CheckResult(
             name="Minimal E2E observability evidence",
             ok=False,
@@ -148,7 +197,6 @@ def _check_minimal_evidence() -> CheckResult:
             risk="Without evidence, trace/log correlation for the MVP chain can't be audited",
         )
 
-    text = TRACE_EVIDENCE_PATH.read_text(encoding="utf-8", errors="replace")
     missing: List[str] = []
 
     if CORRELATION_HEADER not in text:
@@ -25,10 +25,9 @@ import os
 import re
 import subprocess
 import sys
-from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -44,29 +43,30 @@ TRIGGER_RULES = {
     "openapi": re.compile(r"(^|/)openapi[^/]*\.(yml|yaml|json)$", re.IGNORECASE),
     "jobs": re.compile(r"(^|/)jobs/", re.IGNORECASE),
 }
+# Union of all trigger rules: most changed files match none, so one search rejects them.
+TRIGGER_ANY_RX = re.compile("|".join(rx.pattern for rx in TRIGGER_RULES.values()), re.IGNORECASE)
 
 
-@dataclass
-class CheckResult:
+class CheckResult(NamedTuple):
     name: str
     ok: bool
     details: str
 
 
 def _run_git(args: Sequence[str]) -> str:
+    # Read bytes: -z output must not go through newline translation.
     completed = subprocess.run(
         ["git", *args],
         cwd=str(REPO_ROOT),
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
         check=False,
     )
     if completed.returncode != 0:
-        raise RuntimeError(
-            f"git {' '.join(args)} failed (code {completed.returncode}): {completed.stderr.strip()}"
-        )
-    return completed.stdout
+        stderr = completed.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"git {' '.join(args)} failed (code {completed.returncode}): {stderr}")
+    # -z leaves paths unquoted; escape non-UTF-8 bytes so reports stay encodable.
+    return completed.stdout.decode("utf-8", errors="backslashreplace")
 
 
 def _guess_base_head() -> Tuple[Optional[str], Optional[str]]:
@@ -82,23 +82,25 @@ def _guess_base_head() -> Tuple[Optional[str], Optional[str]]:
 
 
 def changed_files(base: Optional[str], head: Optional[str]) -> List[str]:
+    # -z paths are unquoted and already POSIX.
     # Use explicit SHAs when available.
     if base and head:
-        out = _run_git(["diff", "--name-only", f"{base}...{head}"])
-        files = [line.strip().replace("\\", "/") for line in out.splitlines() if line.strip()]
-        return sorted(set(files))
+        out = _run_git(["diff", "--name-only", "-z", f"{base}...{head}"])
+        return sorted({p for p in out.split("\0") if p})
 
     # Local fallback: use staged+unstaged vs HEAD
-    out = _run_git(["status", "--porcelain"])
-    files: List[str] = []
-    for line in out.splitlines():
-        if not line.strip():
-            continue
+    out = _run_git(["status", "--porcelain", "-z"])
+    files: Set[str] = set()
+    records = iter(out.split("\0"))
+    for rec in records:
         # format: XY path
-        path = line[3:].strip()
-        if path:
-            files.append(path.replace("\\", "/"))
-    return sorted(set(files))
+        if len(rec) < 4:
+            continue
+        files.add(rec[3:])
+        # Renames/copies (X or Y column) are followed by the original path as its own record.
+        if "R" in rec[:2] or "C" in rec[:2]:
+            next(records, None)
+    return sorted(files)
 
 
 def read_pr_body() -> str:
@@ -173,6 +175,8 @@ def check_architecture_coupling(files: List[str]) -> CheckResult:
 
     hits: List[str] = []
     for f in files:
+        if not TRIGGER_ANY_RX.search(f):
+            continue
         for label, rx in TRIGGER_RULES.items():
             if rx.search(f):
                 hits.append(f"{label}:{f}")
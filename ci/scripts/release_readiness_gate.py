@@ -35,15 +35,17 @@ import os
 import re
 import subprocess
 import sys
-from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 ARTIFACTS_DIR = REPO_ROOT / "ci_artifacts"
 REPORT_JSON_PATH = ARTIFACTS_DIR / "release-readiness-report.json"
+# Gate 1 runs earlier in the same job and records the same base...head diff.
+PREFLIGHT_REPORT_PATH = ARTIFACTS_DIR / "preflight-report.json"
 
 # Where we accept release notes / runbook content.
 RELEASE_NOTES_CANDIDATES = [
@@ -74,31 +76,32 @@ TRIGGER_RULES = {
 }
 
 
-@dataclass
-class CheckResult:
+class CheckResult(NamedTuple):
     name: str
     ok: bool
     details: str
 
 
+@lru_cache(maxsize=1)
 def _utc_now() -> str:
+    # Same value for the whole run.
     return datetime.now(timezone.utc).isoformat()
 
 
 def _run_git(args: Sequence[str]) -> str:
+    # Bytes, not text, so -z output skips newline translation.
     completed = subprocess.run(
         ["git", *args],
         cwd=str(REPO_ROOT),
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
         check=False,
     )
     if completed.returncode != 0:
-        raise RuntimeError(
-            f"git {' '.join(args)} failed (code {completed.returncode}): {completed.stderr.strip()}"
-        )
-    return completed.stdout
+        stderr = completed.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"git {' '.join(args)} failed (code {completed.returncode}): {stderr}")
+    # -z leaves paths unquoted; escape non-UTF-8 bytes so reports stay encodable.
+    return completed.stdout.decode("utf-8", errors="backslashreplace")
 
 
 def _guess_base_head() -> Tuple[Optional[str], Optional[str]]:
@@ -109,21 +112,42 @@ def _guess_base_head() -> Tuple[Optional[str], Optional[str]]:
     return None, None
 
 
+def _changed_files_from_preflight(base: str, head: str) -> Optional[List[str]]:
+    # Reuse preflight's list only for the exact same base/head; anything else falls back to git.
+    try:
+        report = json.loads(PREFLIGHT_REPORT_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(report, dict) or report.get("base_sha") != base or report.get("head_sha") != head:
+        return None
+    files = report.get("changed_files")
+    if not isinstance(files, list) or not all(isinstance(f, str) for f in files):
+        return None
+    return files
+
+
 def _changed_files(base: Optional[str], head: Optional[str]) -> List[str]:
     if base and head:
-        out = _run_git(["diff", "--name-only", f"{base}...{head}"])
-        files = [line.strip().replace("\\", "/") for line in out.splitlines() if line.strip()]
-        return sorted(set(files))
-
-    out = _run_git(["status", "--porcelain"])
-    files: List[str] = []
-    for line in out.splitlines():
-        if not line.strip():
+        cached = _changed_files_from_preflight(base, head)
+        if cached is not None:
+            return cached
+
+    # -z paths are unquoted and already POSIX.
+    if base and head:
+        out = _run_git(["diff", "--name-only", "-z", f"{base}...{head}"])
+        return sorted({p for p in out.split("\0") if p})
+
+    out = _run_git(["status", "--porcelain", "-z"])
+    files: Set[str] = set()
+    records = iter(out.split("\0"))
+    for rec in records:
+        if len(rec) < 4:
             continue
-        path = line[3:].strip()
-        if path:
-            files.append(path.replace("\\", "/"))
-    return sorted(set(files))
+        files.add(rec[3:])
+        # R/C in either status column means the next record is the original path.
+        if "R" in rec[:2] or "C" in rec[:2]:
+            next(records, None)
+    return sorted(files)
 
 
 def _rel(p: Path) -> str:
@@ -131,8 +155,9 @@ def _rel(p: Path) -> str:
 
 
 def _first_existing(paths: List[Path]) -> Optional[Path]:
+    # is_file() is a single stat and is already False for missing paths.
     for p in paths:
-        if p.exists() and p.is_file():
+        if p.is_file():
             return p
     return None
 
@@ -143,12 +168,12 @@ def _read_text(p: Path) -> str:
 
 def _find_required_sections_in_text(
     *,
-    text: str,
+    hay: str,
     required_any_of: Dict[str, List[str]],
     context_name: str,
 ) -> Tuple[bool, List[str]]:
+    # `hay` is the already-lowercased document, so callers lower each file once.
     missing: List[str] = []
-    hay = text.lower()
     for section, needles in required_any_of.items():
         if not any(n.lower() in hay for n in needles):
             missing.append(f"Missing '{section}' in {context_name} (expected one of: {', '.join(needles)})")
@@ -164,9 +189,8 @@ def check_change_log() -> Tuple[CheckResult, Optional[str]]:
         )
         return CheckResult(name="Change log present (impact + rollback)", ok=False, details=details), None
 
-    text = _read_text(notes_path)
     ok, missing = _find_required_sections_in_text(
-        text=text,
+        hay=_read_text(notes_path).lower(),
         context_name=_rel(notes_path),
         required_any_of={
             "impact scope": ["impact", "影响", "scope", "影响范围"],
@@ -189,7 +213,7 @@ def _looks_like_data_change(changed: List[str]) -> Tuple[bool, List[str]]:
     return len(hits) > 0, hits
 
 
-def check_backward_compat(changed: List[str], *, runbook_text: str, runbook_path: str) -> CheckResult:
+def check_backward_compat(changed: List[str], *, runbook_hay: str, runbook_path: str) -> CheckResult:
     has_data_change, hits = _looks_like_data_change(changed)
     if not has_data_change:
         return CheckResult(
@@ -200,7 +224,7 @@ def check_backward_compat(changed: List[str], *, runbook_text: str, runbook_path
 
     # Require explicit mention to avoid silent breakage.
     ok, missing = _find_required_sections_in_text(
-        text=runbook_text,
+        hay=runbook_hay,
         context_name=runbook_path,
         required_any_of={
             "backward compatibility strategy": ["backward", "兼容", "expand", "contract", "双写", "默认值"],
@@ -233,12 +257,13 @@ def check_runbook() -> Tuple[CheckResult, Optional[str], Optional[str]]:
         )
         return CheckResult(name="Minimal runbook present", ok=False, details=details), None, None
 
-    text = _read_text(runbook_path)
+    # Lowered once; reused for every section check here and by check_backward_compat.
+    hay = _read_text(runbook_path).lower()
 
     # If README used, we require a dedicated section to reduce false positives.
     if runbook_path.name.lower() == "readme.md":
         required_section = "mvp runbook"
-        if required_section not in text.lower():
+        if required_section not in hay:
             return (
                 CheckResult(
                     name="Minimal runbook present",
@@ -249,11 +274,11 @@ def check_runbook() -> Tuple[CheckResult, Optional[str], Optional[str]]:
                     ),
                 ),
                 _rel(runbook_path),
-                text,
+                hay,
             )
 
     ok, missing = _find_required_sections_in_text(
-        text=text,
+        hay=hay,
         context_name=_rel(runbook_path),
         required_any_of={
             "docker compose quickstart": ["docker compose", "docker-compose", "compose"],
@@ -264,7 +289,7 @@ def check_runbook() -> Tuple[CheckResult, Optional[str], Optional[str]]:
     details = (
         f"{'PASS' if ok else 'FAIL'}: checked `{_rel(runbook_path)}`" + ("" if ok else "\n- " + "\n- ".join(missing))
     )
-    return CheckResult(name="Minimal runbook present", ok=ok, details=details), _rel(runbook_path), text
+    return CheckResult(name="Minimal runbook present", ok=ok, details=details), _rel(runbook_path), hay
 
 
 def check_compose_presence() -> CheckResult:
@@ -298,12 +323,12 @@ def main(argv: Sequence[str]) -> int:
         change_log_result, notes_path = check_change_log()
         results.append(change_log_result)
 
-        runbook_result, runbook_path, runbook_text = check_runbook()
+        runbook_result, runbook_path, runbook_hay = check_runbook()
         results.append(runbook_result)
 
         # Backward-compat check is tied to presence of runbook text.
-        if runbook_path and runbook_text is not None:
-            results.append(check_backward_compat(changed, runbook_text=runbook_text, runbook_path=runbook_path))
+        if runbook_path and runbook_hay is not None:
+            results.append(check_backward_compat(changed, runbook_hay=runbook_hay, runbook_path=runbook_path))
         else:
             results.append(
                 CheckResult(
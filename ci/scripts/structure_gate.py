@@ -27,12 +27,14 @@ Notes:
 from __future__ import annotations
 
 import json
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -41,25 +43,22 @@ REPORT_JSON_PATH = ARTIFACTS_DIR / "structure-report.json"
 
 LINE_LIMIT = 250
 
+# Business source extension -> stack reported for over-limit files.
+EXT_STACK = {".dart": "flutter", ".ts": "nestjs", ".py": "fastapi"}
+
 # Only count business source files.
-BUSINESS_EXTS = {".dart", ".ts", ".py"}
+BUSINESS_EXTS = set(EXT_STACK)
 
 # Exclusions per implementation plan 0.4
-EXCLUDE_DIR_PATTERNS = [
-    re.compile(r"(^|/)generated(/|$)", re.IGNORECASE),
-    re.compile(r"(^|/)build(/|$)", re.IGNORECASE),
-    re.compile(r"(^|/)dist(/|$)", re.IGNORECASE),
-    re.compile(r"(^|/)node_modules(/|$)", re.IGNORECASE),
-    re.compile(r"(^|/)\.dart_tool(/|$)", re.IGNORECASE),
-    re.compile(r"(^|/)\.venv(/|$)", re.IGNORECASE),
-    re.compile(r"(^|/)__pycache__(/|$)", re.IGNORECASE),
-]
-
-EXCLUDE_FILE_PATTERNS = [
-    re.compile(r"\.g\.dart$", re.IGNORECASE),
-    re.compile(r"\.d\.ts$", re.IGNORECASE),
-    re.compile(r"\.pb\.[^/]+$", re.IGNORECASE),
-]
+# One alternation per kind, so each path costs two regex searches.
+EXCLUDE_DIR_RE = re.compile(
+    r"(^|/)(generated|build|dist|node_modules|\.dart_tool|\.venv|__pycache__)(/|$)", re.IGNORECASE
+)
+
+EXCLUDE_FILE_RE = re.compile(r"(\.g\.dart|\.d\.ts|\.pb\.[^/]+)$", re.IGNORECASE)
+
+# Line boundaries str.splitlines() honours besides "\n" and "\r" (UTF-8 encoded).
+OTHER_LINE_BREAKS_RE = re.compile(rb"[\x0b\x0c\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
 
 WHITELIST_PATH = REPO_ROOT / "ci" / "line-limit-whitelist.json"
 
@@ -77,10 +76,15 @@ class Violation:
     details: str
 
 
+@dataclass
+class BusinessDir:
+    rel_dir: str
+    business_file_count: int
+    has_py: bool
+
+
 def _is_excluded(rel_posix: str) -> bool:
-    return any(rx.search(rel_posix) for rx in EXCLUDE_DIR_PATTERNS) or any(
-        rx.search(rel_posix) for rx in EXCLUDE_FILE_PATTERNS
-    )
+    return bool(EXCLUDE_DIR_RE.search(rel_posix) or EXCLUDE_FILE_RE.search(rel_posix))
 
 
 def _parse_roots(argv: Sequence[str]) -> List[str]:
@@ -107,19 +111,71 @@ def _parse_roots(argv: Sequence[str]) -> List[str]:
     return roots if roots else list(DEFAULT_SCAN_ROOTS)
 
 
-def _iter_business_files(scan_roots: List[str]) -> Iterable[Path]:
+def _is_excluded_dir(rel_posix: str) -> bool:
+    return EXCLUDE_DIR_RE.search(rel_posix) is not None
+
+
+def _walk_dir(abs_dir: str, rel_dir: str) -> Iterable[Tuple[str, str, List[str], List[str]]]:
+    # Pre-order walk yielding (abs_dir, rel_dir, entry names, file names), in the same order
+    # rglob("*") visits. rel_dir is "" for the repo root itself.
+    # DirEntry.is_file()/is_dir() reuse the d_type from the directory read, so most entries cost
+    # no extra stat; excluded directories are pruned before they are ever listed.
+    names: List[str] = []
+    files: List[str] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(abs_dir) as it:
+            for entry in it:
+                names.append(entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif entry.is_file():
+                    files.append(entry.name)
+    except OSError:
+        return
+    yield abs_dir, rel_dir, names, files
+    for name in subdirs:
+        child_rel = f"{rel_dir}/{name}" if rel_dir else name
+        if _is_excluded_dir(child_rel):
+            continue
+        yield from _walk_dir(os.path.join(abs_dir, name), child_rel)
+
+
+def _suffix(name: str) -> str:
+    # Lower-cased Path(name).suffix, without building a Path per entry.
+    i = name.rfind(".")
+    return name[i:].lower() if 0 < i < len(name) - 1 else ""
+
+
+def _walk_repo(scan_roots: List[str]) -> Tuple[List[Tuple[str, str]], List[BusinessDir]]:
+    # One walk feeds both checks: business files as (absolute, repo-relative) string pairs, and a
+    # summary of every directory that holds at least one of them, both in walk order.
+    files: List[Tuple[str, str]] = []
+    dirs: List[BusinessDir] = []
     # If the repo doesn't have these directories yet, treat as empty (pass).
     for root in scan_roots:
         root_path = (REPO_ROOT / root)
-        if not root_path.exists() or not root_path.is_dir():
+        if not root_path.is_dir():
             continue
-        for p in root_path.rglob("*"):
-            if not p.is_file():
-                continue
-            rel = p.relative_to(REPO_ROOT).as_posix()
-            if _is_excluded(rel):
-                continue
-            yield p
+        root_rel = root_path.relative_to(REPO_ROOT).as_posix()
+        if root_rel == ".":
+            root_rel = ""
+        if _is_excluded_dir(root_rel):
+            continue
+        for abs_dir, rel_dir, names, file_names in _walk_dir(str(root_path), root_rel):
+            count = 0
+            for name in file_names:
+                rel = f"{rel_dir}/{name}" if rel_dir else name
+                if _suffix(name) not in BUSINESS_EXTS or _is_excluded(rel):
+                    continue
+                files.append((os.path.join(abs_dir, name), rel))
+                count += 1
+            if count:
+                # Any *.py entry, excluded or not, mirrors the former dir.glob("*.py") probe.
+                has_py = any(n.endswith(".py") and _suffix(n) == ".py" for n in names)
+                # The repo root keeps the "." that Path.relative_to() reported for it.
+                dirs.append(BusinessDir(rel_dir=rel_dir or ".", business_file_count=count, has_py=has_py))
+    return files, dirs
 
 
 def _read_whitelist() -> Dict[str, Dict[str, Any]]:
@@ -153,40 +209,53 @@ def _read_whitelist() -> Dict[str, Dict[str, Any]]:
     return by_path
 
 
-def _count_lines(path: Path) -> int:
+def _count_lines(path: str) -> int:
     # Count physical lines to keep it simple and reproducible.
-    return len(path.read_text(encoding="utf-8", errors="replace").splitlines())
+    # Same result as len(text.splitlines()) on the decoded text, without decoding or
+    # splitting when "\n" (or "\r\n") is the only line break in the file.
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data:
+        return 0
+    cr = data.count(b"\r")
+    if (cr and cr != data.count(b"\r\n")) or OTHER_LINE_BREAKS_RE.search(data):
+        return len(data.decode("utf-8", errors="replace").splitlines())
+    return data.count(b"\n") + (not data.endswith(b"\n"))
+
+
+def _count_lines_if_over_limit(path: str) -> Optional[int]:
+    # Every line takes at least one byte, so a file this small cannot exceed the limit.
+    if os.stat(path).st_size <= LINE_LIMIT:
+        return None
+    return _count_lines(path)
 
 
-def _classify_stack(path: Path) -> str:
+def _classify_stack(rel_posix: str) -> str:
     # Heuristic: classify by extension.
-    ext = path.suffix.lower()
-    if ext == ".py":
-        return "fastapi"
-    if ext == ".dart":
-        return "flutter"
-    if ext == ".ts":
-        return "nestjs"
-    return "unknown"
+    return EXT_STACK.get(_suffix(rel_posix.rsplit("/", 1)[-1]), "unknown")
 
 
-def check_single_file_line_limits(scan_roots: List[str]) -> Tuple[List[Dict[str, Any]], List[Violation]]:
+def check_single_file_line_limits(
+    business_files: List[Tuple[str, str]]
+) -> Tuple[List[Dict[str, Any]], List[Violation]]:
     whitelist = _read_whitelist()
     overs: List[Dict[str, Any]] = []
     violations: List[Violation] = []
 
-    for p in _iter_business_files(scan_roots):
-        if p.suffix.lower() not in BUSINESS_EXTS:
-            continue
-        rel = p.relative_to(REPO_ROOT).as_posix()
-        line_count = _count_lines(p)
-        if line_count <= LINE_LIMIT:
+    # Reads are I/O bound; count concurrently, then report in walk order.
+    line_counts: List[Optional[int]] = []
+    if business_files:
+        with ThreadPoolExecutor(max_workers=min(8, len(business_files))) as pool:
+            line_counts = list(pool.map(_count_lines_if_over_limit, [a for a, _ in business_files]))
+
+    for (_, rel), line_count in zip(business_files, line_counts):
+        if line_count is None or line_count <= LINE_LIMIT:
             continue
 
         entry = {
             "path": rel,
             "lines": line_count,
-            "stack": _classify_stack(p),
+            "stack": _classify_stack(rel),
             "whitelisted": rel in whitelist,
         }
         if rel in whitelist:
@@ -206,40 +275,24 @@ def check_single_file_line_limits(scan_roots: List[str]) -> Tuple[List[Dict[str,
     return overs, violations
 
 
-def _same_level_file_count(dir_path: Path) -> int:
-    count = 0
-    for child in dir_path.iterdir():
-        if not child.is_file():
-            continue
-        rel = child.relative_to(REPO_ROOT).as_posix()
-        if _is_excluded(rel):
-            continue
-        # Only business source files participate.
-        if child.suffix.lower() not in BUSINESS_EXTS:
-            continue
-        count += 1
-    return count
-
-
-def check_directory_file_counts(scan_roots: List[str]) -> Tuple[List[Dict[str, Any]], List[Violation]]:
+def check_directory_file_counts(
+    business_dirs: List[BusinessDir]
+) -> Tuple[List[Dict[str, Any]], List[Violation]]:
     # "Single business domain directory" isn't yet codified in repo structure.
     # We apply the same-level rule to any directory that contains business files.
     records: List[Dict[str, Any]] = []
     violations: List[Violation] = []
 
     visited: set[str] = set()
-    for p in _iter_business_files(scan_roots):
-        if p.suffix.lower() not in BUSINESS_EXTS:
-            continue
-        d = p.parent
-        rel_dir = d.relative_to(REPO_ROOT).as_posix()
+    for d in business_dirs:
+        rel_dir = d.rel_dir
         if rel_dir in visited:
             continue
         visited.add(rel_dir)
 
-        count = _same_level_file_count(d)
+        count = d.business_file_count
         # determine limit based on dominant stack in dir (python => fastapi limit)
-        stack = "fastapi" if any(x.suffix.lower() == ".py" for x in d.glob("*.py")) else "flutter_or_nest"
+        stack = "fastapi" if d.has_py else "flutter_or_nest"
         limit = FASTAPI_SAME_LEVEL_LIMIT if stack == "fastapi" else FLUTTER_NEST_SAME_LEVEL_LIMIT
 
         record = {
@@ -295,15 +348,23 @@ def _write_report(
         "overall_ok": len(violations) == 0,
     }
 
-    REPORT_JSON_PATH.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    # Rename into place so a partial report is never left behind.
+    tmp_path = REPORT_JSON_PATH.with_suffix(".json.tmp")
+    try:
+        tmp_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_path, REPORT_JSON_PATH)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def main(argv: Sequence[str]) -> int:
     try:
         scan_roots = _parse_roots(argv)
 
-        file_line_overages, v1 = check_single_file_line_limits(scan_roots)
-        directory_counts, v2 = check_directory_file_counts(scan_roots)
+        business_files, business_dirs = _walk_repo(scan_roots)
+        file_line_overages, v1 = check_single_file_line_limits(business_files)
+        directory_counts, v2 = check_directory_file_counts(business_dirs)
 
         # Gate 3.3: not enforced yet because repo boundary rules aren't encoded.
         import_violations: List[Dict[str, Any]] = []
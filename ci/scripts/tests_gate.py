@@ -33,9 +33,11 @@ Notes:
 from __future__ import annotations
 
 import json
+import os
 import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
@@ -64,8 +66,8 @@ def _write_report(report: Dict[str, Any]) -> None:
     )
 
 
-def _iter_files_by_name(name: str) -> List[Path]:
-    exclude_dirs = {
+EXCLUDE_DIRS_LOWER = frozenset(
+    {
         ".git",
         ".idea",
         "ci_artifacts",
@@ -77,14 +79,29 @@ def _iter_files_by_name(name: str) -> List[Path]:
         ".venv",
         "__pycache__",
     }
-    hits: List[Path] = []
-    for p in REPO_ROOT.rglob(name):
-        parts = {x.lower() for x in p.parts}
-        if any(ed.lower() in parts for ed in exclude_dirs):
-            continue
-        if p.is_file() and p.name == name:
-            hits.append(p)
-    return sorted(hits, key=lambda x: x.relative_to(REPO_ROOT).as_posix())
+)
+
+MANIFEST_NAMES = frozenset({"pubspec.yaml", "package.json", "requirements.txt", "pyproject.toml"})
+
+
+@lru_cache(maxsize=1)
+def _manifests_by_name() -> Dict[str, List[Path]]:
+    # One walk collects every manifest the checks ask for; excluded dirs are pruned, not descended.
+    hits: Dict[str, List[Path]] = {name: [] for name in MANIFEST_NAMES}
+    for root, dirs, files in os.walk(REPO_ROOT, followlinks=False):
+        dirs[:] = [d for d in dirs if d.lower() not in EXCLUDE_DIRS_LOWER]
+        for name in files:
+            if name in MANIFEST_NAMES:
+                p = Path(root, name)
+                if p.is_file():
+                    hits[name].append(p)
+    for paths in hits.values():
+        paths.sort(key=lambda x: x.relative_to(REPO_ROOT).as_posix())
+    return hits
+
+
+def _iter_files_by_name(name: str) -> List[Path]:
+    return list(_manifests_by_name()[name])
 
 
 def _rel(p: Path) -> str: